@@ -1,15 +1,13 @@
 import argparse
-import subprocess
 
 from rich import box
 from rich.console import Console
-from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
 from . import core
 from .enums import JobStatus
-from .models import Job
+from .models import Job, JobState
 
 console = Console()
 
@@ -35,8 +33,10 @@ def main() -> None:
         table.add_column("Job name", style="bold white")
         table.add_column("Details", style="dim")
 
-        for i, job in enumerate(jobs, 1):
-            status_display, details = check_job(job)
+        states = core.get_job_states(jobs)
+
+        for i, (job, state) in enumerate(zip(jobs, states), 1):
+            status_display, details = describe_job_state(state)
             table.add_row(str(i), status_display, job.name, details)
 
         console.print(table)
@@ -44,6 +44,11 @@ def main() -> None:
 
 def view_log(job: Job) -> None:
     """Opens the log file for a given job in less."""
+    # Only needed here, so the status table does not pay for importing them
+    import subprocess
+
+    from rich.panel import Panel
+
     state = core.get_job_state(job)
     if not state.file:
         console.print(f"[red]No log file found for [bold]{job.name}[/bold][/red]")
@@ -61,10 +66,8 @@ def view_log(job: Job) -> None:
     subprocess.call(["less", "+G", state.file])
 
 
-def check_job(job: Job) -> tuple[Text, str]:
-    """Checks the status of a job and returns its display text and details."""
-    state = core.get_job_state(job)
-
+def describe_job_state(state: JobState | None) -> tuple[Text, str]:
+    """Returns the display text and details for the state of a job."""
     if not state:
         return _get_status_display(JobStatus.UNKNOWN), "Could not determine job state"
 
@@ -72,9 +75,8 @@ def check_job(job: Job) -> tuple[Text, str]:
 
 
 def _get_status_display(status: JobStatus) -> Text:
-    """Retrieves the UI configuration for a given status."""
-    icon, style = JOB_STATUS_STYLES.get(status, JOB_STATUS_STYLES[JobStatus.UNKNOWN])
-    return Text(f"{icon} {status.value}", style=style)
+    """Retrieves the pre-rendered display text for a given status."""
+    return JOB_STATUS_DISPLAYS.get(status, JOB_STATUS_DISPLAYS[JobStatus.UNKNOWN])
 
 
 JOB_STATUS_STYLES = {
@@ -85,6 +87,13 @@ JOB_STATUS_STYLES = {
     JobStatus.SUCCESS: ("🟢", "green bold"),
     JobStatus.CRASHED: ("🔴", "red bold"),
     JobStatus.UNKNOWN: ("❓", "red"),
+    JobStatus.ERROR: ("❓", "red"),
+}
+
+# Rendering does not modify a Text, so one instance per status is shared by all rows
+JOB_STATUS_DISPLAYS = {
+    status: Text(f"{icon} {status.value}", style=style)
+    for status, (icon, style) in JOB_STATUS_STYLES.items()
 }
 
 
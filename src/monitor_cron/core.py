@@ -1,56 +1,112 @@
+import fnmatch
+import functools
 import glob
-import json
+import io
 import os
-import subprocess
+import re
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Callable
+from typing import Callable, Iterable, Iterator
+
+from pydantic import ValidationError
 
 from .enums import JobFrequency, JobStatus
-from .models import Job, JobState
+from .models import Job, JobsConfig, JobState
 
 # Navigate up from src/monitor_cron/core.py to project root
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(os.path.dirname(BASE_DIR))
 
+# Resolved once, log patterns starting with ~/ are expanded against it
+HOME_DIR = os.path.expanduser("~")
+
 # Standard config location: ~/.config/monitor_cron/jobs.json
-CONFIG_DIR = os.path.expanduser("~/.config/monitor_cron")
+CONFIG_DIR = os.path.join(HOME_DIR, ".config", "monitor_cron")
 CONFIG_FILE = os.path.join(CONFIG_DIR, "jobs.json")
 LOCAL_JOBS_FILE = os.path.join(PROJECT_ROOT, "jobs.json")
 
 JOBS_FILE = CONFIG_FILE if os.path.exists(CONFIG_FILE) else LOCAL_JOBS_FILE
 
-MARKER_FAILED = "[JOB FAILED]"
-MARKER_SUCCESS = "[JOB SUCCEEDED]"
-MARKER_STARTED = "[JOB STARTED]"
+MARKER_FAILED = b"[JOB FAILED]"
+MARKER_SUCCESS = b"[JOB SUCCEEDED]"
+MARKER_STARTED = b"[JOB STARTED]"
+MARKERS = (MARKER_FAILED, MARKER_SUCCESS, MARKER_STARTED)
+# Every marker starts with this, so a single backward search finds them all
+MARKER_PREFIX = b"[JOB "
+# Chunks overlap by this much so that no marker is split between two reads
+MARKER_OVERLAP = max(map(len, MARKERS)) - 1
+
+# Logs are read backwards in chunks, up to the tail size from the end
+LOG_CHUNK_SIZE = 4 * 1024
+LOG_TAIL_SIZE = 64 * 1024
+
+# Reading a log should not write its access time back on every check.
+# O_NOATIME is Linux-only and needs to own the file, so it is optional.
+LOG_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_CLOEXEC", 0)
+LOG_NOATIME_FLAG = getattr(os, "O_NOATIME", 0)
+
+GLOB_MAGIC_PATTERN = re.compile(r"[*?[]")
+
+# Files and directories changed more recently than this are never served from
+# cache, as another change within the same timestamp tick keeps the same mtime
+CACHE_MIN_AGE_NS = 2_000_000_000
+
+PROC_DIR = "/proc"
+
+MAX_WORKERS = 32
 
 
 def load_jobs() -> list[Job]:
-    """Loads jobs from jobs.json."""
+    """
+    Loads jobs from jobs.json, parsing and validating it in a single pass.
+
+    The jobs are sorted from the most to the least frequent.
+    """
+    if not os.path.isfile(JOBS_FILE):
+        problem = "is not a file" if os.path.exists(JOBS_FILE) else "does not exist"
+        print(f"Error loading jobs: {JOBS_FILE} {problem}")
+        return []
+
     try:
-        with open(JOBS_FILE, "r") as f:
-            data = json.load(f)
-            return [Job(**job) for job in data.get("jobs", [])]
-    except Exception as e:
+        with open(JOBS_FILE, "rb") as f:
+            jobs = JobsConfig.model_validate_json(f.read()).jobs
+    except (OSError, ValidationError) as e:
         print(f"Error loading jobs: {e}")
         return []
 
+    # Jobs of the same frequency stay in the order they were configured
+    return sorted(jobs, key=lambda job: FREQUENCY_ORDER[job.frequency])
+
 
-def get_job_state(job: Job) -> JobState:
-    """Returns a JobState object representing the current state of the job."""
+def get_job_state(job: Job, running: dict[str, bool] | None = None) -> JobState:
+    """
+    Returns a JobState object representing the current state of the job.
+
+    `running` is an optional result of `scan_running_processes`. When omitted,
+    the job's process pattern is checked on its own.
+    """
 
-    latest_file = get_latest_log_file(job)
+    latest_log = get_latest_log_file(job)
 
-    if is_job_running(job.process_pattern):
+    if running is None:
+        job_is_running = is_job_running(job.process_pattern)
+    else:
+        job_is_running = running.get(job.process_pattern, False)
+
+    if job_is_running:
         return JobState(
             status=JobStatus.RUNNING,
             message="Process active",
-            file=latest_file,
+            file=latest_log[0] if latest_log else None,
         )
 
-    if not latest_file:
+    if not latest_log:
         return JobState(status=JobStatus.MISSING, message="No logs found", file=None)
 
-    last_log_modification_time = datetime.fromtimestamp(os.path.getmtime(latest_file))
+    latest_file, latest_mtime_ns = latest_log
+    last_log_modification_time = datetime.fromtimestamp(latest_mtime_ns / 1e9)
 
     if not is_execution_within_current_interval(
         last_log_modification_time,
@@ -66,11 +122,56 @@ def get_job_state(job: Job) -> JobState:
     return _analyze_log_file(latest_file, last_log_modification_time)
 
 
-def get_latest_log_file(job: Job) -> str | None:
-    """Returns the most recent log file matching the job's log pattern."""
-    log_pattern = os.path.expanduser(job.log_pattern)
-    files = glob.glob(log_pattern)
-    return max(files, key=os.path.getmtime) if files else None
+def get_job_states(jobs: list[Job]) -> list[JobState]:
+    """
+    Returns the state of every job, in the same order as the jobs.
+
+    Running processes are scanned once for all jobs. The jobs are then checked
+    concurrently, since each check mostly waits on the filesystem.
+    """
+    if not jobs:
+        return []
+
+    running = scan_running_processes([job.process_pattern for job in jobs])
+
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(jobs))) as executor:
+        return list(executor.map(lambda job: get_job_state(job, running), jobs))
+
+
+def get_latest_log_file(job: Job) -> tuple[str, int] | None:
+    """
+    Returns the most recent log file matching the job's log pattern.
+
+    The file is returned with its mtime in nanoseconds, so that callers do not
+    need to stat it again.
+    """
+    location = get_log_location(job)
+
+    if location is None:
+        return _pick_latest_file(glob.glob(_expand_user(job.log_pattern)))
+
+    directory, file_pattern = location
+
+    if not GLOB_MAGIC_PATTERN.search(file_pattern):
+        # A literal path needs a single stat, not a directory listing
+        return _pick_latest_file([os.path.join(directory, file_pattern)])
+
+    return _find_latest_file_in_directory(directory, file_pattern)
+
+
+def get_log_location(job: Job) -> tuple[str, str] | None:
+    """
+    Returns the directory holding the job's logs and the glob of their names.
+
+    ~ is expanded. When the directory is itself a glob, the logs may be spread
+    over several directories and None is returned.
+    """
+    directory, file_pattern = os.path.split(_expand_user(job.log_pattern))
+
+    if GLOB_MAGIC_PATTERN.search(directory):
+        return None
+
+    return directory, file_pattern
 
 
 def is_job_running(pattern: str | None) -> bool:
@@ -78,17 +179,35 @@ def is_job_running(pattern: str | None) -> bool:
     if not pattern:
         return False
 
-    try:
-        return (
-            subprocess.call(
-                args=["pgrep", "-f", pattern],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-            == 0
-        )
-    except Exception:
-        return False
+    return scan_running_processes([pattern])[pattern]
+
+
+def scan_running_processes(patterns: list[str]) -> dict[str, bool]:
+    """
+    Checks several process patterns against the running processes at once.
+
+    Every command line in /proc is read a single time and matched against all
+    patterns, without spawning any subprocess. Like `pgrep -f`, patterns are
+    regular expressions matched against the full command line.
+    """
+    running = dict.fromkeys(patterns, False)
+    regexes, combined = _compile_process_patterns(tuple(patterns))
+
+    if not regexes:
+        return running
+
+    for cmdline in _iter_process_cmdlines():
+        if combined is not None and not combined.search(cmdline):
+            continue
+
+        for pattern, regex in regexes.items():
+            if not running[pattern] and regex.search(cmdline):
+                running[pattern] = True
+
+        if all(running[pattern] for pattern in regexes):
+            break
+
+    return running
 
 
 def is_execution_within_current_interval(
@@ -110,50 +229,288 @@ def is_execution_within_current_interval(
     return check_strategy(last_run, current_time)
 
 
+def _expand_user(path: str) -> str:
+    """Expands ~ and ~/ with the cached home directory, ~user with expanduser."""
+    if path == "~":
+        return HOME_DIR
+
+    if path.startswith("~/"):
+        return os.path.join(HOME_DIR, path[2:])
+
+    if path.startswith("~"):
+        return os.path.expanduser(path)
+
+    return path
+
+
+def _find_latest_file_in_directory(
+    directory: str, file_pattern: str
+) -> tuple[str, int] | None:
+    """
+    Returns the most recently modified file of a directory matching a glob.
+
+    The matching names are cached per directory mtime, so the directory is
+    only listed again once files have been added, removed or renamed in it.
+    """
+    try:
+        directory_mtime_ns = os.stat(directory or os.curdir).st_mtime_ns
+    except OSError:
+        return None
+
+    if time.time_ns() - directory_mtime_ns < CACHE_MIN_AGE_NS:
+        list_files = _list_matching_files.__wrapped__
+    else:
+        list_files = _list_matching_files
+
+    try:
+        files = list_files(directory, file_pattern, directory_mtime_ns)
+    except OSError:
+        return None
+
+    return _pick_latest_file(files)
+
+
+def _pick_latest_file(paths: Iterable[str]) -> tuple[str, int] | None:
+    """Returns the newest regular file of the paths with its mtime, one stat each."""
+    latest: tuple[str, int] | None = None
+
+    for path in paths:
+        try:
+            file_stat = os.stat(path)
+        except OSError:
+            # The file was removed since it was listed
+            continue
+
+        if not stat.S_ISREG(file_stat.st_mode):
+            continue
+
+        if latest is None or file_stat.st_mtime_ns > latest[1]:
+            latest = (path, file_stat.st_mtime_ns)
+
+    return latest
+
+
+@functools.lru_cache(maxsize=256)
+def _list_matching_files(
+    directory: str, file_pattern: str, directory_mtime_ns: int
+) -> tuple[str, ...]:
+    """
+    Lists the regular files of a directory matching a glob, in a single scandir.
+
+    `directory_mtime_ns` is only part of the cache key. As with glob, hidden
+    files only match patterns starting with a dot.
+    """
+    name_regex = _compile_file_pattern(file_pattern)
+    include_hidden = file_pattern.startswith(".")
+
+    with os.scandir(directory or os.curdir) as entries:
+        return tuple(
+            os.path.join(directory, entry.name)
+            for entry in entries
+            if (include_hidden or not entry.name.startswith("."))
+            and name_regex.match(entry.name)
+            and entry.is_file()
+        )
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_file_pattern(file_pattern: str) -> re.Pattern[str]:
+    """Translates and compiles a glob once, as the job patterns never change."""
+    return re.compile(fnmatch.translate(file_pattern))
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_process_patterns(
+    patterns: tuple[str, ...],
+) -> tuple[dict[str, re.Pattern[bytes]], re.Pattern[bytes] | None]:
+    """
+    Compiles the valid, non-empty patterns. Invalid ones never match, like pgrep.
+
+    The patterns are also combined into a single alternation, so that most
+    command lines are rejected in one search. Combining renumbers groups, so
+    there is no alternation when a pattern has groups or it fails to compile.
+    The jobs do not change while the monitor runs, so this is only done once
+    per set of patterns.
+    """
+    regexes: dict[str, re.Pattern[bytes]] = {}
+    for pattern in patterns:
+        if not pattern or pattern in regexes:
+            continue
+
+        try:
+            regexes[pattern] = re.compile(b"(?:" + pattern.encode() + b")")
+        except re.error:
+            continue
+
+    if not regexes or any(regex.groups for regex in regexes.values()):
+        return regexes, None
+
+    try:
+        combined = re.compile(b"|".join(regex.pattern for regex in regexes.values()))
+    except re.error:
+        return regexes, None
+
+    return regexes, combined
+
+
+def _iter_process_cmdlines() -> Iterator[bytes]:
+    """Yields the command line of every other process, arguments space-separated."""
+    own_pid = str(os.getpid())
+
+    try:
+        entries = list(os.scandir(PROC_DIR))
+    except OSError:
+        return
+
+    for entry in entries:
+        if not entry.name.isdigit() or entry.name == own_pid:
+            continue
+
+        try:
+            with open(os.path.join(entry.path, "cmdline"), "rb") as f:
+                cmdline = f.read()
+        except OSError:
+            # The process exited while we were scanning
+            continue
+
+        if cmdline:
+            yield cmdline.rstrip(b"\0").replace(b"\0", b" ")
+
+
 def _analyze_log_file(filepath: str, modification_time: datetime) -> JobState:
-    """Reads the log file and determines status based on content markers."""
+    """
+    Reads the log file and determines status based on content markers.
+
+    The state is cached per path and mtime, so an unchanged log is not read
+    again on every check. Errors are not cached.
+    """
+    if time.time() - modification_time.timestamp() < CACHE_MIN_AGE_NS / 1e9:
+        read_log_state = _read_log_state.__wrapped__
+    else:
+        read_log_state = _read_log_state
+
     try:
-        with open(filepath, "r", errors="replace") as f:
-            content = f.read()
-
-        if MARKER_FAILED in content:
-            return JobState(
-                status=JobStatus.FAILED,
-                message="Failed",
-                file=filepath,
-                last_modification_time=modification_time,
-            )
+        return read_log_state(filepath, modification_time)
+    except Exception as e:
+        return JobState(
+            status=JobStatus.ERROR,
+            message=str(e),
+            file=filepath,
+        )
 
-        if MARKER_SUCCESS in content:
-            return JobState(
-                status=JobStatus.SUCCESS,
-                message="Finished",
-                file=filepath,
-                last_modification_time=modification_time,
-            )
 
-        if MARKER_STARTED in content:
-            return JobState(
-                status=JobStatus.CRASHED,
-                message="Crashed",
-                file=filepath,
-                last_modification_time=modification_time,
-            )
+@functools.lru_cache(maxsize=256)
+def _read_log_state(filepath: str, modification_time: datetime) -> JobState:
+    """
+    Determines the state of a log file from its last marker.
 
+    The last marker in the log wins, so that a run appended to the same log
+    file is judged on its own outcome and not on an earlier run.
+    """
+    marker = _find_last_marker_in_file(filepath)
+
+    if marker == MARKER_FAILED:
         return JobState(
-            status=JobStatus.UNKNOWN,
-            message="Unknown log format",
+            status=JobStatus.FAILED,
+            message="Failed",
             file=filepath,
             last_modification_time=modification_time,
         )
 
-    except Exception as e:
+    if marker == MARKER_SUCCESS:
         return JobState(
-            status=JobStatus.ERROR,
-            message=str(e),
+            status=JobStatus.SUCCESS,
+            message="Finished",
             file=filepath,
+            last_modification_time=modification_time,
         )
 
+    if marker == MARKER_STARTED:
+        return JobState(
+            status=JobStatus.CRASHED,
+            message="Crashed",
+            file=filepath,
+            last_modification_time=modification_time,
+        )
+
+    return JobState(
+        status=JobStatus.UNKNOWN,
+        message="Unknown log format",
+        file=filepath,
+        last_modification_time=modification_time,
+    )
+
+
+def _find_last_marker_in_file(filepath: str) -> bytes | None:
+    """
+    Returns the last state marker of a log file, if any.
+
+    The file is read backwards in chunks, since the final marker is almost
+    always on one of the last lines. Only the last LOG_TAIL_SIZE bytes are
+    searched this way; when they hold no marker, the rest of the file is
+    scanned forward in buffer-sized chunks.
+    """
+    try:
+        fd = os.open(filepath, LOG_OPEN_FLAGS | LOG_NOATIME_FLAG)
+    except PermissionError:
+        fd = os.open(filepath, LOG_OPEN_FLAGS)
+
+    try:
+        size = os.fstat(fd).st_size
+        end = size
+
+        while end > 0 and size - end < LOG_TAIL_SIZE:
+            start = max(0, end - LOG_CHUNK_SIZE)
+            marker = _find_last_marker(
+                os.pread(fd, end - start + MARKER_OVERLAP, start)
+            )
+            if marker:
+                return marker
+
+            end = start
+
+        return _scan_for_last_marker(fd, end + MARKER_OVERLAP) if end > 0 else None
+    finally:
+        os.close(fd)
+
+
+def _scan_for_last_marker(fd: int, length: int) -> bytes | None:
+    """
+    Returns the last state marker in the first `length` bytes of a file.
+
+    Only one buffer is held in memory at a time. The end of each buffer is
+    carried over to the next one so that markers spanning two reads are
+    still found.
+    """
+    marker = None
+    carry = b""
+    offset = 0
+
+    while offset < length:
+        chunk = os.pread(fd, min(io.DEFAULT_BUFFER_SIZE, length - offset), offset)
+        if not chunk:
+            break
+
+        offset += len(chunk)
+        content = carry + chunk
+        marker = _find_last_marker(content) or marker
+        carry = content[-MARKER_OVERLAP:]
+
+    return marker
+
+
+def _find_last_marker(content: bytes) -> bytes | None:
+    """Returns the state marker that appears last in the content."""
+    end = len(content)
+    while (index := content.rfind(MARKER_PREFIX, 0, end)) >= 0:
+        for marker in MARKERS:
+            if content.startswith(marker, index):
+                return marker
+
+        end = index
+
+    return None
+
 
 def _check_daily(last_run: datetime, current_time: datetime) -> bool:
     return last_run.date() == current_time.date()
@@ -174,3 +531,5 @@ FREQUENCY_STRATEGIES: dict[JobFrequency, Callable[[datetime, datetime], bool]] =
     JobFrequency.WEEKLY: _check_weekly,
     JobFrequency.MONTHLY: _check_monthly,
 }
+
+FREQUENCY_ORDER = {frequency: index for index, frequency in enumerate(JobFrequency)}
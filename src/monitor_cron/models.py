@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from .enums import JobFrequency, JobStatus
 
@@ -12,7 +12,13 @@ class Job(BaseModel):
     process_pattern: str
 
 
+class JobsConfig(BaseModel):
+    jobs: list[Job] = []
+
+
 class JobState(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     status: JobStatus
     message: str
     file: str | None
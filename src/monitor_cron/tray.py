@@ -1,7 +1,10 @@
+import fnmatch
+import functools
+import itertools
 import os
 import signal
 import sys
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, Iterator
 
 import gi
 
@@ -11,7 +14,7 @@ from .models import Job, JobState
 
 gi.require_version("Gtk", "3.0")
 gi.require_version("Gdk", "3.0")
-from gi.repository import GLib, Gtk  # noqa: E402
+from gi.repository import Gio, GLib, Gtk  # noqa: E402
 
 
 def main() -> None:
@@ -30,6 +33,12 @@ class CronMonitorApp(Gtk.Application):
         self.menu: Any | None = None
         self.jobs: list[Job] = []
         self.job_rows: list[JobRow] = []
+        self.log_monitors: list[Any] = []
+        self.watched_rows: dict[str, list[tuple[str, JobRow]]] = {}
+        self.unwatched_rows: list[JobRow] = []
+        self.changed_rows: list[JobRow] = []
+        self.changed_logs_source_id: int | None = None
+        self.first_change_time = 0
 
     def do_activate(self) -> None:
         # This is a tray-only app. No main window required.
@@ -45,18 +54,26 @@ class CronMonitorApp(Gtk.Application):
         self._build_menu()
         self.tray = TrayController("cron_monitor_id", self.menu)
 
-        # Start the loop
+        # Log changes refresh their rows. Running jobs and logs that cannot be
+        # watched are polled, and everything is refreshed now and then to catch
+        # what never touches a log (jobs starting, days rolling over).
         self.refresh_jobs()
-        GLib.timeout_add_seconds(60, self._on_timer_tick)
+        GLib.timeout_add_seconds(REFRESH_SECONDS, self._on_poll_tick)
+        GLib.timeout_add_seconds(FALLBACK_REFRESH_SECONDS, self._on_timer_tick)
 
     def _build_menu(self) -> None:
         """Constructs the tray menu sections grouped by frequency."""
         if not self.menu:
             return
 
-        jobs_by_frequency = _group_jobs_by_frequency(self.jobs)
+        # Start from an empty menu so that rebuilding never duplicates rows
+        for child in self.menu.get_children():
+            self.menu.remove(child)
+        self.job_rows.clear()
 
-        for i, (frequency, jobs) in enumerate(jobs_by_frequency.items()):
+        jobs_by_frequency = _iter_jobs_by_frequency(self.jobs)
+
+        for i, (frequency, jobs) in enumerate(jobs_by_frequency):
             if i > 0:
                 self.menu.append(GSeparatorMenuItem())
 
@@ -69,6 +86,7 @@ class CronMonitorApp(Gtk.Application):
 
         self._add_footer()
         self.menu.show_all()
+        self._watch_log_directories()
 
     def _add_header(self, label: str) -> None:
         if self.menu is None:
@@ -87,23 +105,122 @@ class CronMonitorApp(Gtk.Application):
         quit_item.connect("activate", lambda _: self.quit())
         self.menu.append(quit_item)
 
+    def _watch_log_directories(self) -> None:
+        """Monitors the log directories of the current rows, replacing old monitors."""
+        for monitor in self.log_monitors:
+            monitor.cancel()
+        self.log_monitors.clear()
+        self.watched_rows.clear()
+        self.unwatched_rows.clear()
+        self.changed_rows.clear()
+        if self.changed_logs_source_id is not None:
+            GLib.source_remove(self.changed_logs_source_id)
+            self.changed_logs_source_id = None
+
+        rows_by_directory: dict[str, list[tuple[str, JobRow]]] = {}
+        for row in self.job_rows:
+            location = core.get_log_location(row.job)
+
+            if location is None:
+                self.unwatched_rows.append(row)
+                continue
+
+            directory, file_pattern = location
+            rows_by_directory.setdefault(os.path.abspath(directory), []).append(
+                (file_pattern, row)
+            )
+
+        for directory, rows in rows_by_directory.items():
+            try:
+                monitor = Gio.File.new_for_path(directory).monitor_directory(
+                    Gio.FileMonitorFlags.NONE, None
+                )
+            except GLib.Error as e:
+                print(f"Failed to watch {directory}: {e}")
+                self.unwatched_rows.extend(row for _, row in rows)
+                continue
+
+            monitor.connect("changed", self._on_log_changed)
+            # The monitor stops once it is garbage collected
+            self.log_monitors.append(monitor)
+            self.watched_rows[directory] = rows
+
+    def _on_log_changed(
+        self, _monitor: Any, changed_file: Any, _other_file: Any, _event: Any
+    ) -> None:
+        path = changed_file.get_path()
+        if not path:
+            return
+
+        directory, file_name = os.path.split(path)
+        for file_pattern, row in self.watched_rows.get(directory, []):
+            # Running jobs write to their log constantly, they are polled instead
+            if row.state and row.state.status == JobStatus.RUNNING:
+                continue
+
+            if (
+                fnmatch.fnmatch(file_name, file_pattern)
+                and row not in self.changed_rows
+            ):
+                self.changed_rows.append(row)
+
+        if not self.changed_rows:
+            return
+
+        # Refresh once the writes stop, but do not put it off forever
+        now = GLib.get_monotonic_time()
+        if self.changed_logs_source_id is None:
+            self.first_change_time = now
+        elif now - self.first_change_time < LOG_CHANGE_MAX_DELAY_MS * 1000:
+            GLib.source_remove(self.changed_logs_source_id)
+        else:
+            return
+
+        self.changed_logs_source_id = GLib.timeout_add(
+            LOG_CHANGE_DELAY_MS, self._on_logs_settled
+        )
+
+    def _on_logs_settled(self) -> bool:
+        rows, self.changed_rows = self.changed_rows, []
+        self.changed_logs_source_id = None
+        self.refresh_jobs(rows)
+        return False
+
+    def _on_poll_tick(self) -> bool:
+        rows = [
+            row
+            for row in self.job_rows
+            if row in self.unwatched_rows
+            or (row.state and row.state.status == JobStatus.RUNNING)
+        ]
+        if rows:
+            self.refresh_jobs(rows)
+        return True
+
     def _on_timer_tick(self) -> bool:
         self.refresh_jobs()
         return True
 
-    def refresh_jobs(self) -> None:
+    def refresh_jobs(self, rows: list["JobRow"] | None = None) -> None:
+        """Refreshes the given rows, or all of them, and the tray icon."""
         if not self.tray:
             return
 
-        current_statuses = [
-            row.update(core.get_job_state(row.job)) for row in self.job_rows
-        ]
+        if rows is None:
+            rows = self.job_rows
+
+        # The logs are checked concurrently, the widgets are updated here
+        states = core.get_job_states([row.job for row in rows])
+        for row, state in zip(rows, states):
+            row.update(state)
 
+        current_statuses = [row.state.status for row in self.job_rows if row.state]
         global_icon, global_description = _get_global_app_status(current_statuses)
         self.tray.set_status(global_icon, global_description)
 
-    def open_log(self, job: Job) -> None:
-        result = core.get_job_state(job)
+    def open_log(self, row: "JobRow") -> None:
+        # Reuse the state from the last refresh instead of searching the logs again
+        result = row.state or core.get_job_state(row.job)
         if result.file:
             try:
                 GShowUri(
@@ -117,12 +234,13 @@ class TrayController:
     """Manages the system tray icon."""
 
     def __init__(self, app_id: str, menu: Any) -> None:
-        self.indicator = _get_app_indicator().Indicator.new(
+        app_indicator = _get_app_indicator()
+        self.indicator = app_indicator.Indicator.new(
             app_id,
             TRAY_ICON_SUCCESS,
-            _get_app_indicator().IndicatorCategory.APPLICATION_STATUS,  # type: ignore
+            app_indicator.IndicatorCategory.APPLICATION_STATUS,
         )
-        self.indicator.set_status(_get_app_indicator().IndicatorStatus.ACTIVE)  # type: ignore
+        self.indicator.set_status(app_indicator.IndicatorStatus.ACTIVE)
         self.indicator.set_menu(menu)
 
     def set_status(self, icon_name: str, description: str) -> None:
@@ -132,9 +250,10 @@ class TrayController:
 class JobRow:
     """Manages the UI elements (menu items) for a single job."""
 
-    def __init__(self, job: Job, open_log_callback: Callable[[Job], None]) -> None:
+    def __init__(self, job: Job, open_log_callback: Callable[["JobRow"], None]) -> None:
         self.job = job
         self.open_log_callback = open_log_callback
+        self.state: JobState | None = None
 
         # UI components
         self.root_item = GMenuItem(label=f"Initializing {job.name}")
@@ -145,11 +264,16 @@ class JobRow:
         self.time_item = self._add_item("Time: --", sensitive=False)
         self.log_item = self._add_item("Open log file", sensitive=True)
 
-        self.log_item.connect("activate", lambda _: self.open_log_callback(self.job))
+        self.log_item.connect("activate", lambda _: self.open_log_callback(self))
         self.log_item.hide()
 
-    def update(self, state: JobState) -> str:
-        """Updates the UI and returns the current status string."""
+    def update(self, state: JobState) -> None:
+        """Updates the UI with the given state."""
+        # Most ticks find nothing new, so skip the widget updates and redraws
+        if state == self.state:
+            return
+
+        self.state = state
 
         # Update main label
         icon = JOB_STATUS_ICONS.get(state.status, JOB_STATUS_ICONS[JobStatus.UNKNOWN])
@@ -172,8 +296,6 @@ class JobRow:
         else:
             self.log_item.hide()
 
-        return state.status
-
     def _add_item(self, label: str, sensitive: bool = True) -> Any:
         item = GMenuItem(label=label)
         item.set_sensitive(sensitive)
@@ -181,24 +303,18 @@ class JobRow:
         return item
 
 
-def _group_jobs_by_frequency(jobs: list[Job]) -> dict[str, list[Job]]:
-    groups: dict[str, list[Job]] = {}
-    for job in jobs:
-        groups.setdefault(job.frequency, []).append(job)
-    return groups
+def _iter_jobs_by_frequency(jobs: list[Job]) -> Iterator[tuple[str, Iterator[Job]]]:
+    """Groups consecutive jobs, which load_jobs already sorted by frequency."""
+    return itertools.groupby(jobs, key=lambda job: job.frequency)
 
 
-def _get_global_app_status(statuses: list[str]) -> tuple[str, str]:
+def _get_global_app_status(statuses: Iterable[JobStatus]) -> tuple[str, str]:
     """Determines the tray icon based on the worst status in the list."""
-    if any(status in FAIL_STATUSES for status in statuses):
-        return TRAY_ICON_FAIL, "Job failure detected"
-
-    if any(status in WARN_STATUSES for status in statuses):
-        return TRAY_ICON_WARN, "Warnings present"
-
-    return TRAY_ICON_SUCCESS, "All systems operational"
+    severity = max((STATUS_SEVERITY[status] for status in statuses), default=0)
+    return GLOBAL_APP_STATUSES[severity]
 
 
+@functools.lru_cache(maxsize=1)
 def _get_app_indicator() -> Any:
     """Lazy loads AppIndicator to keep the top-level import clean."""
     try:
@@ -217,6 +333,11 @@ def _get_app_indicator() -> Any:
             sys.exit(1)
 
 
+REFRESH_SECONDS = 60
+FALLBACK_REFRESH_SECONDS = 300
+LOG_CHANGE_DELAY_MS = 1000
+LOG_CHANGE_MAX_DELAY_MS = 10_000
+
 TRAY_ICON_SUCCESS = "emblem-default"
 TRAY_ICON_WARN = "emblem-synchronizing"
 TRAY_ICON_FAIL = "emblem-important"
@@ -232,8 +353,23 @@ JOB_STATUS_ICONS = {
     JobStatus.ERROR: "⚪",
 }
 
-FAIL_STATUSES = {JobStatus.FAILED, JobStatus.CRASHED, JobStatus.ERROR}
-WARN_STATUSES = {JobStatus.STALE, JobStatus.MISSING, JobStatus.UNKNOWN}
+# Indexed by the severity of the worst job status
+GLOBAL_APP_STATUSES: tuple[tuple[str, str], ...] = (
+    (TRAY_ICON_SUCCESS, "All systems operational"),
+    (TRAY_ICON_WARN, "Warnings present"),
+    (TRAY_ICON_FAIL, "Job failure detected"),
+)
+
+STATUS_SEVERITY: dict[JobStatus, int] = {
+    JobStatus.SUCCESS: 0,
+    JobStatus.RUNNING: 0,
+    JobStatus.STALE: 1,
+    JobStatus.MISSING: 1,
+    JobStatus.UNKNOWN: 1,
+    JobStatus.FAILED: 2,
+    JobStatus.CRASHED: 2,
+    JobStatus.ERROR: 2,
+}
 
 # Type-checker workaround for dynamic Gtk 3 bindings
 GMenu: Any = Gtk.Menu  # type: ignore
@@ -7,10 +7,25 @@ from typing import Any, Generator
 
 import pytest
 
+from monitor_cron import core
 from monitor_cron.enums import JobFrequency, JobStatus
 from monitor_cron.models import Job, JobState
 
 
+@pytest.fixture(autouse=True)
+def clear_core_caches() -> Generator[None, Any, None]:
+    """Make sure cached listings, patterns and states do not leak between tests."""
+    core._list_matching_files.cache_clear()
+    core._compile_file_pattern.cache_clear()
+    core._compile_process_patterns.cache_clear()
+    core._read_log_state.cache_clear()
+    yield
+    core._list_matching_files.cache_clear()
+    core._compile_file_pattern.cache_clear()
+    core._compile_process_patterns.cache_clear()
+    core._read_log_state.cache_clear()
+
+
 @pytest.fixture
 def temp_dir() -> Generator[Path, Any, None]:
     """Create a temporary directory for test files."""
@@ -1,5 +1,7 @@
 from datetime import datetime
 
+from pytest import MonkeyPatch
+
 from monitor_cron import core
 from monitor_cron.enums import JobFrequency
 
@@ -140,3 +142,19 @@ class TestIsExecutionWithinCurrentInterval:
         )
 
         assert result is True
+
+    def test_dispatches_through_frequency_strategies(
+        self, monkeypatch: MonkeyPatch
+    ) -> None:
+        """Test that the check is looked up in FREQUENCY_STRATEGIES."""
+        monkeypatch.setitem(
+            core.FREQUENCY_STRATEGIES, JobFrequency.DAILY, lambda last, now: False
+        )
+
+        result = core.is_execution_within_current_interval(
+            last_run=datetime(2026, 2, 1, 10, 0),
+            frequency=JobFrequency.DAILY,
+            current_time=datetime(2026, 2, 1, 15, 0),
+        )
+
+        assert result is False
@@ -17,7 +17,7 @@ class TestGetJobState:
 
         with patch.object(core, "is_job_running", return_value=True):
             with patch.object(
-                core, "get_latest_log_file", return_value="/var/log/test.log"
+                core, "get_latest_log_file", return_value=("/var/log/test.log", 0)
             ):
                 state = core.get_job_state(job)
 
@@ -51,7 +51,12 @@ class TestGetJobState:
 
         with patch.object(core, "is_job_running", return_value=False):
             with patch.object(
-                core, "get_latest_log_file", return_value=str(log_file_with_success)
+                core,
+                "get_latest_log_file",
+                return_value=(
+                    str(log_file_with_success),
+                    log_file_with_success.stat().st_mtime_ns,
+                ),
             ):
                 with patch.object(core, "datetime") as mock_datetime:
                     mock_datetime.now.return_value = datetime(2026, 2, 1, 12, 0)
@@ -80,7 +85,12 @@ class TestGetJobState:
 
         with patch.object(core, "is_job_running", return_value=False):
             with patch.object(
-                core, "get_latest_log_file", return_value=str(log_file_with_success)
+                core,
+                "get_latest_log_file",
+                return_value=(
+                    str(log_file_with_success),
+                    log_file_with_success.stat().st_mtime_ns,
+                ),
             ):
                 with patch.object(core, "datetime") as mock_datetime:
                     mock_datetime.now.return_value = datetime(2026, 2, 1, 15, 0)
@@ -108,7 +118,12 @@ class TestGetJobState:
 
         with patch.object(core, "is_job_running", return_value=False):
             with patch.object(
-                core, "get_latest_log_file", return_value=str(log_file_with_failure)
+                core,
+                "get_latest_log_file",
+                return_value=(
+                    str(log_file_with_failure),
+                    log_file_with_failure.stat().st_mtime_ns,
+                ),
             ):
                 with patch.object(core, "datetime") as mock_datetime:
                     mock_datetime.now.return_value = datetime(2026, 2, 1, 15, 0)
@@ -136,7 +151,12 @@ class TestGetJobState:
 
         with patch.object(core, "is_job_running", return_value=False):
             with patch.object(
-                core, "get_latest_log_file", return_value=str(log_file_with_crash)
+                core,
+                "get_latest_log_file",
+                return_value=(
+                    str(log_file_with_crash),
+                    log_file_with_crash.stat().st_mtime_ns,
+                ),
             ):
                 with patch.object(core, "datetime") as mock_datetime:
                     mock_datetime.now.return_value = datetime(2026, 2, 1, 15, 0)
@@ -150,3 +170,225 @@ class TestGetJobState:
         assert state.message == "Crashed"
         assert state.file == str(log_file_with_crash)
         assert state.last_modification_time == datetime.fromtimestamp(today_time)
+
+    def test_get_job_state_uses_running_snapshot(self, sample_jobs: list[Job]) -> None:
+        """Test that a precomputed process scan is used instead of pgrep."""
+        job = sample_jobs[0]
+        running = {job.process_pattern: True}
+
+        with patch.object(core, "is_job_running") as mock_is_job_running:
+            with patch.object(
+                core, "get_latest_log_file", return_value=("/var/log/test.log", 0)
+            ):
+                state = core.get_job_state(job, running)
+
+        mock_is_job_running.assert_not_called()
+        assert state.status == JobStatus.RUNNING
+        assert state.file == "/var/log/test.log"
+
+    def test_get_job_state_looks_up_latest_log_once(
+        self, sample_jobs: list[Job]
+    ) -> None:
+        """Test that the log directory is searched only once per call."""
+        job = sample_jobs[0]
+
+        for is_running in (True, False):
+            with patch.object(core, "is_job_running", return_value=is_running):
+                with patch.object(
+                    core, "get_latest_log_file", return_value=None
+                ) as mock_get_latest_log_file:
+                    core.get_job_state(job)
+
+            mock_get_latest_log_file.assert_called_once_with(job)
+
+    def test_get_job_state_builds_modification_time_once(
+        self,
+        sample_jobs: list[Job],
+        log_file_with_success: Path,
+    ) -> None:
+        """Test that the log mtime is converted to a datetime a single time."""
+        job = sample_jobs[0]
+
+        today_time = datetime(2026, 2, 1, 12, 0).timestamp()
+        os.utime(log_file_with_success, (today_time, today_time))
+
+        with patch.object(core, "is_job_running", return_value=False):
+            with patch.object(
+                core,
+                "get_latest_log_file",
+                return_value=(
+                    str(log_file_with_success),
+                    log_file_with_success.stat().st_mtime_ns,
+                ),
+            ):
+                with patch.object(core, "datetime") as mock_datetime:
+                    mock_datetime.now.return_value = datetime(2026, 2, 1, 15, 0)
+                    mock_datetime.fromtimestamp.return_value = datetime.fromtimestamp(
+                        today_time
+                    )
+
+                    core.get_job_state(job)
+
+        mock_datetime.fromtimestamp.assert_called_once_with(today_time)
+
+    def test_get_job_state_end_to_end(
+        self,
+        sample_jobs: list[Job],
+        log_file_with_success: Path,
+    ) -> None:
+        """Test the full lookup, using the mtime found while searching the logs."""
+        job = sample_jobs[0]
+        job.log_pattern = str(log_file_with_success.parent / "test-*.log")
+
+        today_time = datetime(2026, 2, 1, 12, 0).timestamp()
+        os.utime(log_file_with_success, (today_time, today_time))
+
+        with patch.object(core, "is_job_running", return_value=False):
+            with patch.object(os.path, "getmtime") as mock_getmtime:
+                with patch.object(core, "datetime", wraps=datetime) as mock_datetime:
+                    mock_datetime.now.return_value = datetime(2026, 2, 1, 15, 0)
+
+                    state = core.get_job_state(job)
+
+        mock_getmtime.assert_not_called()
+        assert state.status == JobStatus.SUCCESS
+        assert state.file == str(log_file_with_success)
+        assert state.last_modification_time == datetime.fromtimestamp(today_time)
+
+    def test_get_job_state_stats_log_once(
+        self,
+        sample_jobs: list[Job],
+        log_file_with_success: Path,
+    ) -> None:
+        """Test that the log is stat'ed once, reading its mtime from that stat."""
+        job = sample_jobs[0]
+        job.log_pattern = str(log_file_with_success)
+
+        with patch.object(core, "is_job_running", return_value=False):
+            with patch.object(os, "stat", wraps=os.stat) as mock_stat:
+                state = core.get_job_state(job)
+
+        stated_paths = [str(call.args[0]) for call in mock_stat.call_args_list]
+        assert stated_paths.count(str(log_file_with_success)) == 1
+        assert state.status == JobStatus.SUCCESS
+
+    def test_get_job_state_reuses_unchanged_log(
+        self,
+        sample_jobs: list[Job],
+        log_file_with_success: Path,
+    ) -> None:
+        """Test that a log is not read again while its mtime stays the same."""
+        job = sample_jobs[0]
+
+        today_time = datetime(2026, 2, 1, 12, 0).timestamp()
+        os.utime(log_file_with_success, (today_time, today_time))
+        latest_log = (
+            str(log_file_with_success),
+            log_file_with_success.stat().st_mtime_ns,
+        )
+
+        with patch.object(core, "is_job_running", return_value=False):
+            with patch.object(core, "get_latest_log_file", return_value=latest_log):
+                with patch.object(core, "datetime", wraps=datetime) as mock_datetime:
+                    mock_datetime.now.return_value = datetime(2026, 2, 1, 15, 0)
+                    with patch.object(
+                        core,
+                        "_find_last_marker_in_file",
+                        wraps=core._find_last_marker_in_file,
+                    ) as mock_read:
+                        first = core.get_job_state(job)
+                        second = core.get_job_state(job)
+
+        mock_read.assert_called_once()
+        assert first == second
+        assert second.status == JobStatus.SUCCESS
+
+    def test_get_job_state_reads_changed_log_again(
+        self,
+        sample_jobs: list[Job],
+        log_file_with_success: Path,
+    ) -> None:
+        """Test that a log is read again once its mtime changes."""
+        job = sample_jobs[0]
+
+        first_time = datetime(2026, 2, 1, 12, 0).timestamp()
+        os.utime(log_file_with_success, (first_time, first_time))
+        first_log = (
+            str(log_file_with_success),
+            log_file_with_success.stat().st_mtime_ns,
+        )
+
+        with patch.object(core, "is_job_running", return_value=False):
+            with patch.object(core, "datetime", wraps=datetime) as mock_datetime:
+                mock_datetime.now.return_value = datetime(2026, 2, 1, 15, 0)
+
+                with patch.object(core, "get_latest_log_file", return_value=first_log):
+                    first = core.get_job_state(job)
+
+                log_file_with_success.write_text("[JOB STARTED]\n[JOB FAILED]\n")
+                second_time = datetime(2026, 2, 1, 13, 0).timestamp()
+                os.utime(log_file_with_success, (second_time, second_time))
+                second_log = (
+                    str(log_file_with_success),
+                    log_file_with_success.stat().st_mtime_ns,
+                )
+
+                with patch.object(core, "get_latest_log_file", return_value=second_log):
+                    second = core.get_job_state(job)
+
+        assert first.status == JobStatus.SUCCESS
+        assert second.status == JobStatus.FAILED
+
+    def test_get_job_state_does_not_cache_recent_log(
+        self,
+        sample_jobs: list[Job],
+        log_file_with_success: Path,
+    ) -> None:
+        """Test that a log modified within the cache age is read on every call."""
+        job = sample_jobs[0]
+        latest_log = (
+            str(log_file_with_success),
+            log_file_with_success.stat().st_mtime_ns,
+        )
+
+        with patch.object(core, "is_job_running", return_value=False):
+            with patch.object(core, "get_latest_log_file", return_value=latest_log):
+                with patch.object(
+                    core,
+                    "_find_last_marker_in_file",
+                    wraps=core._find_last_marker_in_file,
+                ) as mock_read:
+                    core.get_job_state(job)
+                    core.get_job_state(job)
+
+        assert mock_read.call_count == 2
+
+
+class TestGetJobStates:
+    """Tests for the get_job_states function."""
+
+    def test_get_job_states_keeps_job_order(self, sample_jobs: list[Job]) -> None:
+        """Test that states are returned in the order of the jobs."""
+        running = {job.process_pattern: job is sample_jobs[1] for job in sample_jobs}
+
+        with patch.object(core, "scan_running_processes", return_value=running):
+            with patch.object(core, "get_latest_log_file", return_value=None):
+                states = core.get_job_states(sample_jobs)
+
+        assert [state.status for state in states] == [
+            JobStatus.MISSING,
+            JobStatus.RUNNING,
+            JobStatus.MISSING,
+        ]
+
+    def test_get_job_states_scans_processes_once(self, sample_jobs: list[Job]) -> None:
+        """Test that running processes are scanned once for all jobs."""
+        with patch.object(core, "scan_running_processes", return_value={}) as mock_scan:
+            with patch.object(core, "get_latest_log_file", return_value=None):
+                core.get_job_states(sample_jobs)
+
+        mock_scan.assert_called_once_with([job.process_pattern for job in sample_jobs])
+
+    def test_get_job_states_no_jobs(self) -> None:
+        """Test that no jobs give no states."""
+        assert core.get_job_states([]) == []
@@ -2,7 +2,7 @@ import json
 import os
 from pathlib import Path
 
-from pytest import MonkeyPatch
+from pytest import CaptureFixture, MonkeyPatch
 
 from monitor_cron import core
 from monitor_cron.enums import JobFrequency
@@ -31,6 +31,44 @@ class TestLoadJobs:
         assert jobs[2].name == "Monthly Cleanup"
         assert jobs[2].frequency == JobFrequency.MONTHLY
 
+    def test_load_jobs_sorted_by_frequency(
+        self,
+        temp_dir: Path,
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        """Test that jobs are sorted by frequency, keeping the configured order."""
+        jobs_data = {
+            "jobs": [
+                {
+                    "name": name,
+                    "frequency": frequency,
+                    "log_pattern": "test",
+                    "process_pattern": "test",
+                }
+                for name, frequency in [
+                    ("Monthly job", "monthly"),
+                    ("Daily job B", "daily"),
+                    ("Weekly job", "weekly"),
+                    ("Daily job A", "daily"),
+                ]
+            ]
+        }
+
+        jobs_file = temp_dir / "unsorted.json"
+        with open(jobs_file, "w") as f:
+            json.dump(jobs_data, f)
+
+        monkeypatch.setattr(core, "JOBS_FILE", str(jobs_file))
+
+        jobs = core.load_jobs()
+
+        assert [job.name for job in jobs] == [
+            "Daily job B",
+            "Daily job A",
+            "Weekly job",
+            "Monthly job",
+        ]
+
     def test_load_jobs_empty_file(
         self,
         temp_dir: Path,
@@ -45,13 +83,46 @@ class TestLoadJobs:
 
         assert jobs == []
 
-    def test_load_jobs_file_not_found(self, monkeypatch: MonkeyPatch) -> None:
+    def test_load_jobs_without_jobs_key(
+        self,
+        temp_dir: Path,
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        """Test loading from a file that has no jobs key."""
+        config_file = temp_dir / "no_jobs.json"
+        config_file.write_text("{}")
+        monkeypatch.setattr(core, "JOBS_FILE", str(config_file))
+
+        jobs = core.load_jobs()
+
+        assert jobs == []
+
+    def test_load_jobs_file_not_found(
+        self,
+        monkeypatch: MonkeyPatch,
+        capsys: CaptureFixture[str],
+    ) -> None:
         """Test handling of missing jobs file."""
         monkeypatch.setattr(core, "JOBS_FILE", "/nonexistent/path.json")
 
         jobs = core.load_jobs()
 
         assert jobs == []
+        assert "/nonexistent/path.json does not exist" in capsys.readouterr().out
+
+    def test_load_jobs_path_is_directory(
+        self,
+        temp_dir: Path,
+        monkeypatch: MonkeyPatch,
+        capsys: CaptureFixture[str],
+    ) -> None:
+        """Test that a directory in place of the jobs file is reported."""
+        monkeypatch.setattr(core, "JOBS_FILE", str(temp_dir))
+
+        jobs = core.load_jobs()
+
+        assert jobs == []
+        assert f"{temp_dir} is not a file" in capsys.readouterr().out
 
     def test_load_jobs_from_config_dir(
         self,
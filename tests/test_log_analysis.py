@@ -1,6 +1,9 @@
+import fnmatch
+import io
 import os
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 from pytest import MonkeyPatch
 
@@ -76,8 +79,8 @@ class TestAnalyzeLogFile:
             or "does not exist" in result.message.lower()
         )
 
-    def test_analyze_log_priority_failed_over_success(self, temp_dir: Path) -> None:
-        """Test that failed marker takes priority over success marker."""
+    def test_analyze_log_last_marker_wins(self, temp_dir: Path) -> None:
+        """Test that the marker closest to the end of the log decides the status."""
         log_file = temp_dir / "both-markers.log"
         log_file.write_text("[JOB STARTED]\n[JOB SUCCEEDED]\n[JOB FAILED]\n")
 
@@ -89,6 +92,208 @@ class TestAnalyzeLogFile:
         assert result.file == str(log_file)
         assert result.last_modification_time == modification_time
 
+    def test_analyze_large_log_with_success_marker(self, temp_dir: Path) -> None:
+        """Test that the success marker is found at the end of a large log."""
+        log_file = temp_dir / "large-success.log"
+        filler = "Processing item\n" * (2 * core.LOG_TAIL_SIZE // 16)
+        log_file.write_text(f"[JOB STARTED]\n{filler}[JOB SUCCEEDED]\n")
+
+        modification_time = datetime.fromtimestamp(os.path.getmtime(log_file))
+        result = core._analyze_log_file(str(log_file), modification_time)
+
+        assert result.status == JobStatus.SUCCESS
+        assert result.message == "Finished"
+
+    def test_analyze_large_log_with_crash(self, temp_dir: Path) -> None:
+        """Test that a large log with only a start marker is reported as crashed."""
+        log_file = temp_dir / "large-crash.log"
+        filler = "Processing item\n" * (2 * core.LOG_TAIL_SIZE // 16)
+        log_file.write_text(f"[JOB STARTED]\n{filler}")
+
+        modification_time = datetime.fromtimestamp(os.path.getmtime(log_file))
+        result = core._analyze_log_file(str(log_file), modification_time)
+
+        assert result.status == JobStatus.CRASHED
+        assert result.message == "Crashed"
+
+    def test_analyze_large_log_reads_only_the_tail(self, temp_dir: Path) -> None:
+        """Test that a marker near the end is found without reading the whole log."""
+        log_file = temp_dir / "large-tail.log"
+        filler = "Processing item\n" * (4 * core.LOG_TAIL_SIZE // 16)
+        log_file.write_text(f"[JOB STARTED]\n{filler}[JOB FAILED]\n")
+
+        modification_time = datetime.fromtimestamp(os.path.getmtime(log_file))
+        with patch.object(core.os, "pread", wraps=os.pread) as mock_pread:
+            result = core._analyze_log_file(str(log_file), modification_time)
+
+        bytes_read = sum(call.args[1] for call in mock_pread.call_args_list)
+        assert result.status == JobStatus.FAILED
+        assert bytes_read <= core.LOG_CHUNK_SIZE + core.MARKER_OVERLAP
+
+    def test_analyze_log_without_noatime_permission(
+        self, log_file_with_success: Path
+    ) -> None:
+        """Test that logs owned by another user are opened without O_NOATIME."""
+        real_open = os.open
+
+        def open_without_noatime(path: str, flags: int) -> int:
+            if flags & core.LOG_NOATIME_FLAG:
+                raise PermissionError("Operation not permitted")
+            return real_open(path, flags)
+
+        modification_time = datetime.fromtimestamp(
+            os.path.getmtime(log_file_with_success)
+        )
+        with patch.object(core.os, "open", side_effect=open_without_noatime):
+            result = core._analyze_log_file(
+                str(log_file_with_success), modification_time
+            )
+
+        assert result.status == JobStatus.SUCCESS
+        assert result.message == "Finished"
+
+    def test_analyze_log_reuses_state_of_unchanged_log(
+        self, log_file_with_success: Path
+    ) -> None:
+        """Test that a log is read once while its path and mtime stay the same."""
+        old_time = datetime(2026, 2, 1, 12, 0).timestamp()
+        os.utime(log_file_with_success, (old_time, old_time))
+        modification_time = datetime.fromtimestamp(old_time)
+
+        with patch.object(
+            core, "_find_last_marker_in_file", wraps=core._find_last_marker_in_file
+        ) as mock_read:
+            first = core._analyze_log_file(
+                str(log_file_with_success), modification_time
+            )
+            second = core._analyze_log_file(
+                str(log_file_with_success), modification_time
+            )
+
+        mock_read.assert_called_once()
+        assert first == second
+        assert second.status == JobStatus.SUCCESS
+
+    def test_analyze_log_does_not_cache_errors(self, temp_dir: Path) -> None:
+        """Test that a log that could not be read is tried again."""
+        log_file = temp_dir / "unreadable.log"
+        modification_time = datetime(2026, 2, 1, 12, 0)
+
+        first = core._analyze_log_file(str(log_file), modification_time)
+        log_file.write_text("[JOB STARTED]\n[JOB SUCCEEDED]\n")
+        second = core._analyze_log_file(str(log_file), modification_time)
+
+        assert first.status == JobStatus.ERROR
+        assert second.status == JobStatus.SUCCESS
+
+    def test_analyze_log_rerun_after_failure(self, temp_dir: Path) -> None:
+        """Test that a later run appended to the same log decides the status."""
+        log_file = temp_dir / "rerun.log"
+        log_file.write_text(
+            "[JOB STARTED]\n[JOB FAILED]\n[JOB STARTED]\nRetrying...\n[JOB SUCCEEDED]\n"
+        )
+
+        modification_time = datetime.fromtimestamp(os.path.getmtime(log_file))
+        result = core._analyze_log_file(str(log_file), modification_time)
+
+        assert result.status == JobStatus.SUCCESS
+        assert result.message == "Finished"
+
+    def test_analyze_log_marker_across_chunk_boundary(self, temp_dir: Path) -> None:
+        """Test that a marker split between two chunks is still found."""
+        log_file = temp_dir / "boundary.log"
+        marker = b"[JOB FAILED]"
+        # The first chunk read from the end starts in the middle of the marker
+        trailer = b"y" * (core.LOG_CHUNK_SIZE - len(marker) // 2)
+        log_file.write_bytes(b"[JOB STARTED]\n" + b"x" * 10_000 + marker + trailer)
+
+        modification_time = datetime.fromtimestamp(os.path.getmtime(log_file))
+        result = core._analyze_log_file(str(log_file), modification_time)
+
+        assert result.status == JobStatus.FAILED
+        assert result.message == "Failed"
+
+    def test_analyze_large_log_with_marker_before_tail(self, temp_dir: Path) -> None:
+        """Test that a marker followed by a lot of output is still found."""
+        log_file = temp_dir / "large-trailing-output.log"
+        trailing = "Cleaning up\n" * (2 * core.LOG_TAIL_SIZE // 12)
+        log_file.write_text(f"[JOB STARTED]\n[JOB SUCCEEDED]\n{trailing}")
+
+        modification_time = datetime.fromtimestamp(os.path.getmtime(log_file))
+        result = core._analyze_log_file(str(log_file), modification_time)
+
+        assert result.status == JobStatus.SUCCESS
+        assert result.message == "Finished"
+
+    def test_analyze_log_with_invalid_utf8(self, temp_dir: Path) -> None:
+        """Test that undecodable bytes do not prevent finding the markers."""
+        log_file = temp_dir / "binary-output.log"
+        log_file.write_bytes(b"[JOB STARTED]\n\xff\xfe\x80 garbage\n[JOB SUCCEEDED]\n")
+
+        modification_time = datetime.fromtimestamp(os.path.getmtime(log_file))
+        result = core._analyze_log_file(str(log_file), modification_time)
+
+        assert result.status == JobStatus.SUCCESS
+        assert result.message == "Finished"
+
+
+class TestScanForLastMarker:
+    """Tests for the _scan_for_last_marker function."""
+
+    def test_scan_for_last_marker_across_buffers(self, temp_dir: Path) -> None:
+        """Test that a marker split between two buffered reads is found."""
+        log_file = temp_dir / "split.log"
+        marker = b"[JOB STARTED]"
+        padding = b"x" * (io.DEFAULT_BUFFER_SIZE - len(marker) // 2)
+        log_file.write_bytes(padding + marker + b"y" * io.DEFAULT_BUFFER_SIZE)
+
+        fd = os.open(log_file, os.O_RDONLY)
+        try:
+            marker_found = core._scan_for_last_marker(fd, log_file.stat().st_size)
+        finally:
+            os.close(fd)
+
+        assert marker_found == core.MARKER_STARTED
+
+    def test_scan_for_last_marker_stops_at_length(self, temp_dir: Path) -> None:
+        """Test that content past the given length is ignored."""
+        log_file = temp_dir / "limited.log"
+        log_file.write_bytes(b"[JOB STARTED]\n[JOB FAILED]\n")
+
+        fd = os.open(log_file, os.O_RDONLY)
+        try:
+            marker_found = core._scan_for_last_marker(fd, len(b"[JOB STARTED]\n"))
+        finally:
+            os.close(fd)
+
+        assert marker_found == core.MARKER_STARTED
+
+
+class TestFindLastMarker:
+    """Tests for the _find_last_marker function."""
+
+    def test_find_last_marker_returns_last_marker(self) -> None:
+        """Test that the marker closest to the end is returned."""
+        content = b"[JOB STARTED]\nProcessing...\n[JOB SUCCEEDED]\n"
+
+        assert core._find_last_marker(content) == core.MARKER_SUCCESS
+
+    def test_find_last_marker_started_after_outcome(self) -> None:
+        """Test a new run started after a previous one finished."""
+        content = b"[JOB STARTED]\n[JOB FAILED]\n[JOB STARTED]\nProcessing...\n"
+
+        assert core._find_last_marker(content) == core.MARKER_STARTED
+
+    def test_find_last_marker_no_markers(self) -> None:
+        """Test content without any marker."""
+        assert core._find_last_marker(b"JOB SUCCEEDED without brackets\n") is None
+
+    def test_find_last_marker_skips_other_job_tags(self) -> None:
+        """Test that tags sharing the marker prefix do not hide an earlier marker."""
+        content = b"[JOB STARTED]\n[JOB FAILED]\n[JOB PROGRESS] 50%\n[JOB \n"
+
+        assert core._find_last_marker(content) == core.MARKER_FAILED
+
 
 class TestGetLatestLogFile:
     """Tests for the get_latest_log_file function."""
@@ -106,7 +311,10 @@ class TestGetLatestLogFile:
         latest = core.get_latest_log_file(job)
 
         # Should return the file with the latest modification time (2026-02-03)
-        assert latest == str(multiple_log_files[2])
+        assert latest == (
+            str(multiple_log_files[2]),
+            multiple_log_files[2].stat().st_mtime_ns,
+        )
 
     def test_get_latest_log_file_no_matches(self, sample_jobs: list[Job]) -> None:
         """Test when no files match the pattern."""
@@ -128,19 +336,246 @@ class TestGetLatestLogFile:
         log_file = temp_dir / "test.log"
         log_file.write_text("test")
 
-        original_expanduser = os.path.expanduser
+        monkeypatch.setattr(core, "HOME_DIR", str(temp_dir))
 
-        def mock_expanduser(path: str) -> str:
-            if path.startswith("~"):
-                start_index = len("~") + 1
-                return str(temp_dir / path[start_index:])
-            return original_expanduser(path)
+        job = sample_jobs[0]
+        job.log_pattern = "~/test.log"
+
+        latest = core.get_latest_log_file(job)
 
-        monkeypatch.setattr(os.path, "expanduser", mock_expanduser)
+        assert latest == (str(log_file), log_file.stat().st_mtime_ns)
+
+    def test_get_latest_log_file_ignores_hidden_files(
+        self,
+        multiple_log_files: list[Path],
+        sample_jobs: list[Job],
+    ) -> None:
+        """Test that hidden files are skipped, as glob does."""
+        hidden_file = multiple_log_files[0].parent / ".backup-2026-02-04.log"
+        hidden_file.write_text("[JOB SUCCEEDED]\n")
 
         job = sample_jobs[0]
-        job.log_pattern = "~/test.log"
+        job.log_pattern = str(multiple_log_files[0].parent / "*.log")
+
+        latest = core.get_latest_log_file(job)
+
+        assert latest == (
+            str(multiple_log_files[2]),
+            multiple_log_files[2].stat().st_mtime_ns,
+        )
+
+    def test_get_latest_log_file_with_wildcard_directory(
+        self,
+        temp_dir: Path,
+        sample_jobs: list[Job],
+    ) -> None:
+        """Test patterns with wildcards in the directory part."""
+        for i, name in enumerate(["first", "second"]):
+            log_dir = temp_dir / f"run-{name}"
+            log_dir.mkdir()
+            log_file = log_dir / "job.log"
+            log_file.write_text("[JOB SUCCEEDED]\n")
+
+            timestamp = datetime(2026, 2, i + 1, 12, 0).timestamp()
+            os.utime(log_file, (timestamp, timestamp))
+
+        job = sample_jobs[0]
+        job.log_pattern = str(temp_dir / "run-*" / "job.log")
+
+        latest = core.get_latest_log_file(job)
+
+        expected_file = temp_dir / "run-second" / "job.log"
+        assert latest == (str(expected_file), expected_file.stat().st_mtime_ns)
+
+    def test_get_latest_log_file_stats_each_candidate_once(
+        self,
+        multiple_log_files: list[Path],
+        sample_jobs: list[Job],
+    ) -> None:
+        """Test that the directory and each matching file are stat'ed once."""
+        log_dir = multiple_log_files[0].parent
+        (log_dir / "unrelated.txt").write_text("not a log")
+
+        job = sample_jobs[0]
+        job.log_pattern = str(log_dir / "backup-*.log")
+
+        with patch.object(os, "stat", wraps=os.stat) as mock_stat:
+            core.get_latest_log_file(job)
+
+        stated_paths = [str(call.args[0]) for call in mock_stat.call_args_list]
+        assert sorted(stated_paths) == sorted(
+            [str(log_dir)] + [str(log_file) for log_file in multiple_log_files]
+        )
+
+    def test_get_latest_log_file_reuses_directory_listing(
+        self,
+        multiple_log_files: list[Path],
+        sample_jobs: list[Job],
+    ) -> None:
+        """Test that an unchanged directory is not listed again."""
+        log_dir = multiple_log_files[0].parent
+        old_time = datetime(2026, 2, 3, 13, 0).timestamp()
+        os.utime(log_dir, (old_time, old_time))
+
+        job = sample_jobs[0]
+        job.log_pattern = str(log_dir / "backup-*.log")
+
+        with patch.object(os, "scandir", wraps=os.scandir) as mock_scandir:
+            first = core.get_latest_log_file(job)
+            second = core.get_latest_log_file(job)
+
+        expected_file = multiple_log_files[2]
+        assert first == second == (str(expected_file), expected_file.stat().st_mtime_ns)
+        mock_scandir.assert_called_once()
+
+    def test_get_latest_log_file_lists_changed_directory_again(
+        self,
+        multiple_log_files: list[Path],
+        sample_jobs: list[Job],
+    ) -> None:
+        """Test that a new file invalidates the cached directory listing."""
+        log_dir = multiple_log_files[0].parent
+        old_time = datetime(2026, 2, 3, 13, 0).timestamp()
+        os.utime(log_dir, (old_time, old_time))
+
+        job = sample_jobs[0]
+        job.log_pattern = str(log_dir / "backup-*.log")
+        assert core.get_latest_log_file(job) == (
+            str(multiple_log_files[2]),
+            multiple_log_files[2].stat().st_mtime_ns,
+        )
+
+        new_file = log_dir / "backup-2026-02-04.log"
+        new_file.write_text("[JOB SUCCEEDED]\n")
+
+        assert core.get_latest_log_file(job) == (
+            str(new_file),
+            new_file.stat().st_mtime_ns,
+        )
+
+    def test_get_latest_log_file_translates_pattern_once(
+        self,
+        multiple_log_files: list[Path],
+        sample_jobs: list[Job],
+    ) -> None:
+        """Test that listing a changed directory again reuses the compiled glob."""
+        log_dir = multiple_log_files[0].parent
+        job = sample_jobs[0]
+        job.log_pattern = str(log_dir / "backup-*.log")
+
+        with patch.object(core.fnmatch, "translate", wraps=fnmatch.translate) as mock:
+            core.get_latest_log_file(job)
+            (log_dir / "backup-2026-02-04.log").write_text("[JOB SUCCEEDED]\n")
+            core.get_latest_log_file(job)
+
+        mock.assert_called_once_with("backup-*.log")
+
+    def test_get_latest_log_file_with_literal_path(
+        self,
+        log_file_with_success: Path,
+        sample_jobs: list[Job],
+    ) -> None:
+        """Test that a pattern without wildcards is checked without listing."""
+        job = sample_jobs[0]
+        job.log_pattern = str(log_file_with_success)
+
+        with patch.object(os, "scandir") as mock_scandir:
+            latest = core.get_latest_log_file(job)
+
+        assert latest == (
+            str(log_file_with_success),
+            log_file_with_success.stat().st_mtime_ns,
+        )
+        mock_scandir.assert_not_called()
+
+    def test_get_latest_log_file_ignores_directories(
+        self,
+        multiple_log_files: list[Path],
+        sample_jobs: list[Job],
+    ) -> None:
+        """Test that a directory matching the pattern is never returned."""
+        log_dir = multiple_log_files[0].parent
+        (log_dir / "backup-2026-02-04.log").mkdir()
+
+        job = sample_jobs[0]
+        job.log_pattern = str(log_dir / "backup-*.log")
+
+        latest = core.get_latest_log_file(job)
+
+        expected_file = multiple_log_files[2]
+        assert latest == (str(expected_file), expected_file.stat().st_mtime_ns)
+
+    def test_get_latest_log_file_with_missing_literal_path(
+        self,
+        temp_dir: Path,
+        sample_jobs: list[Job],
+    ) -> None:
+        """Test a pattern without wildcards pointing to a missing file."""
+        job = sample_jobs[0]
+        job.log_pattern = str(temp_dir / "missing.log")
 
         latest = core.get_latest_log_file(job)
 
-        assert latest == str(log_file)
+        assert latest is None
+
+
+class TestGetLogLocation:
+    """Tests for the get_log_location function."""
+
+    def test_get_log_location_splits_pattern(self, sample_jobs: list[Job]) -> None:
+        """Test that the directory and the file glob are returned separately."""
+        job = sample_jobs[0]
+        job.log_pattern = "/var/log/backup/backup-*.log"
+
+        assert core.get_log_location(job) == ("/var/log/backup", "backup-*.log")
+
+    def test_get_log_location_expands_home(
+        self, sample_jobs: list[Job], monkeypatch: MonkeyPatch
+    ) -> None:
+        """Test that ~/ is expanded in the directory."""
+        monkeypatch.setattr(core, "HOME_DIR", "/home/tester")
+        job = sample_jobs[0]
+        job.log_pattern = "~/logs/job.log"
+
+        assert core.get_log_location(job) == ("/home/tester/logs", "job.log")
+
+    def test_get_log_location_with_wildcard_directory(
+        self, sample_jobs: list[Job]
+    ) -> None:
+        """Test that logs spread over several directories have no single location."""
+        job = sample_jobs[0]
+        job.log_pattern = "/var/log/*/backup-*.log"
+
+        assert core.get_log_location(job) is None
+
+
+class TestExpandUser:
+    """Tests for the _expand_user function."""
+
+    def test_expand_user_with_home_prefix(self, monkeypatch: MonkeyPatch) -> None:
+        """Test that ~/ is replaced by the cached home directory."""
+        monkeypatch.setattr(core, "HOME_DIR", "/home/tester")
+
+        assert core._expand_user("~/logs/*.log") == "/home/tester/logs/*.log"
+        assert core._expand_user("~") == "/home/tester"
+
+    def test_expand_user_with_root_home(self, monkeypatch: MonkeyPatch) -> None:
+        """Test that a home directory of / does not produce a double slash."""
+        monkeypatch.setattr(core, "HOME_DIR", "/")
+        monkeypatch.setenv("HOME", "/")
+
+        assert core._expand_user("~/logs/a-*.log") == "/logs/a-*.log"
+        assert core._expand_user("~/logs/a-*.log") == os.path.expanduser(
+            "~/logs/a-*.log"
+        )
+        assert core._expand_user("~") == "/"
+
+    def test_expand_user_without_tilde(self) -> None:
+        """Test that other paths are returned unchanged."""
+        assert core._expand_user("/var/log/*.log") == "/var/log/*.log"
+
+    def test_expand_user_with_other_user(self, monkeypatch: MonkeyPatch) -> None:
+        """Test that ~user paths are still expanded by expanduser."""
+        monkeypatch.setattr(os.path, "expanduser", lambda path: "/home/other/x.log")
+
+        assert core._expand_user("~other/x.log") == "/home/other/x.log"
@@ -114,3 +114,8 @@ class TestJobState:
                 message="Test",
                 file=None,
             )
+
+    def test_job_state_is_immutable(self, sample_job_state: JobState) -> None:
+        """Test that a JobState cannot be modified once created."""
+        with pytest.raises(ValidationError):
+            sample_job_state.status = JobStatus.FAILED  # type: ignore
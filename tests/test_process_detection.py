@@ -1,4 +1,6 @@
+import re
 import subprocess
+from pathlib import Path
 from unittest.mock import patch
 
 from monitor_cron import core
@@ -9,14 +11,16 @@ class TestIsJobRunning:
 
     def test_is_job_running_process_found(self) -> None:
         """Test when process is found."""
-        with patch.object(subprocess, "call", return_value=0):
+        cmdlines = [b"/bin/bash /etc/cron.daily/test_process"]
+
+        with patch.object(core, "_iter_process_cmdlines", return_value=cmdlines):
             result = core.is_job_running("test_process")
 
         assert result is True
 
     def test_is_job_running_process_not_found(self) -> None:
         """Test when process is not found."""
-        with patch.object(subprocess, "call", return_value=1):
+        with patch.object(core, "_iter_process_cmdlines", return_value=[b"other"]):
             result = core.is_job_running("nonexistent_process")
 
         assert result is False
@@ -33,23 +37,109 @@ class TestIsJobRunning:
 
         assert result is False
 
-    def test_is_job_running_exception_handling(self) -> None:
-        """Test exception handling in is_job_running."""
-        with patch.object(subprocess, "call", side_effect=Exception("Test error")):
+    def test_is_job_running_unreadable_proc(self, temp_dir: Path) -> None:
+        """Test that a missing /proc is handled as no process running."""
+        with patch.object(core, "PROC_DIR", str(temp_dir / "missing")):
             result = core.is_job_running("test_process")
 
         assert result is False
 
-    def test_is_job_running_calls_pgrep_correctly(self) -> None:
-        """Test that pgrep is called with correct arguments."""
-        with patch.object(subprocess, "call", return_value=0) as mock_call:
-            core.is_job_running("my_process")
+    def test_is_job_running_does_not_spawn_pgrep(self) -> None:
+        """Test that processes are detected without a subprocess."""
+        with patch.object(subprocess, "call") as mock_call:
+            with patch.object(
+                core, "_iter_process_cmdlines", return_value=[b"my_process"]
+            ):
+                result = core.is_job_running("my_process")
+
+        assert result is True
+        mock_call.assert_not_called()
+
+
+class TestScanRunningProcesses:
+    """Tests for the scan_running_processes function."""
+
+    def test_scan_running_processes_matches_each_pattern(self) -> None:
+        """Test that every pattern is checked against the command lines."""
+        cmdlines = [b"/bin/bash /etc/cron.daily/backup_music", b"python worker.py"]
+
+        with patch.object(core, "_iter_process_cmdlines", return_value=cmdlines):
+            result = core.scan_running_processes(
+                ["backup_music", "worker", "generate_report"]
+            )
+
+        assert result == {
+            "backup_music": True,
+            "worker": True,
+            "generate_report": False,
+        }
+
+    def test_scan_running_processes_uses_regular_expressions(self) -> None:
+        """Test that patterns are regular expressions, like with pgrep -f."""
+        cmdlines = [b"/usr/bin/python3 backup_script.py --full"]
+
+        with patch.object(core, "_iter_process_cmdlines", return_value=cmdlines):
+            result = core.scan_running_processes(["backup_.*\\.py", "^backup"])
+
+        assert result == {"backup_.*\\.py": True, "^backup": False}
+
+    def test_scan_running_processes_ignores_empty_and_invalid_patterns(self) -> None:
+        """Test that empty and invalid patterns are reported as not running."""
+        with patch.object(
+            core, "_iter_process_cmdlines", return_value=[b"anything"]
+        ) as mock_iter:
+            result = core.scan_running_processes(["", "[unclosed"])
+
+        assert result == {"": False, "[unclosed": False}
+        mock_iter.assert_not_called()
+
+    def test_scan_running_processes_with_backreferences(self) -> None:
+        """Test that group numbers stay valid when several patterns are checked."""
+        cmdlines = [b"python aa worker"]
+
+        with patch.object(core, "_iter_process_cmdlines", return_value=cmdlines):
+            result = core.scan_running_processes(["(x)y", "(a)\\1"])
+
+        assert result == {"(x)y": False, "(a)\\1": True}
+
+    def test_scan_running_processes_with_duplicate_group_names(self) -> None:
+        """Test that patterns reusing a group name are each checked on their own."""
+        cmdlines = [b"/usr/bin/backup_music", b"python report.py"]
+        patterns = ["(?P<job>backup)_music", "(?P<job>report)\\.py", "(?P<job>sync)"]
+
+        with patch.object(core, "_iter_process_cmdlines", return_value=cmdlines):
+            result = core.scan_running_processes(patterns)
+
+        assert result == dict(zip(patterns, [True, True, False]))
+
+    def test_scan_running_processes_reads_proc_once(self) -> None:
+        """Test that /proc is walked a single time for all patterns."""
+        with patch.object(
+            core, "_iter_process_cmdlines", return_value=[b"other"]
+        ) as mock_iter:
+            core.scan_running_processes(["first", "second", "third"])
+
+        mock_iter.assert_called_once()
+
+    def test_scan_running_processes_compiles_patterns_once(self) -> None:
+        """Test that repeated scans for the same jobs reuse the compiled patterns."""
+        with patch.object(core, "_iter_process_cmdlines", return_value=[b"other"]):
+            with patch.object(core.re, "compile", wraps=re.compile) as mock_compile:
+                core.scan_running_processes(["first", "second"])
+                compile_count = mock_compile.call_count
+                core.scan_running_processes(["first", "second"])
+
+        assert compile_count == 3
+        assert mock_compile.call_count == compile_count
+
+    def test_iter_process_cmdlines_joins_arguments(self, temp_dir: Path) -> None:
+        """Test that NUL-separated arguments are joined with spaces."""
+        process_dir = temp_dir / "1234"
+        process_dir.mkdir()
+        (process_dir / "cmdline").write_bytes(b"python\0worker.py\0--fast\0")
+        (temp_dir / "self").mkdir()
 
-            mock_call.assert_called_once()
-            args = mock_call.call_args[1]["args"]
+        with patch.object(core, "PROC_DIR", str(temp_dir)):
+            cmdlines = list(core._iter_process_cmdlines())
 
-            assert args[0] == "pgrep"
-            assert args[1] == "-f"
-            assert args[2] == "my_process"
-            assert mock_call.call_args[1]["stdout"] == subprocess.DEVNULL
-            assert mock_call.call_args[1]["stderr"] == subprocess.DEVNULL
+        assert cmdlines == [b"python worker.py --fast"]